@@ -1,13 +1,19 @@
 import streamlit as st
 import pandas as pd
 import os
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import json
 import numpy as np
 import geopandas as gpd
+import shapely
+from pandas.api.types import union_categoricals
 import sys # Import sys for object size checking
 
+# Serialize figures with orjson; the default JSON encoder dominates st.plotly_chart time
+# for the animated figures with many frames
+pio.json.config.default_engine = "orjson"
+
 # Page setup
 st.set_page_config(layout="wide", page_title="India FoodCrop Dashboard", page_icon="🌾")
 
@@ -62,6 +68,21 @@ html, body, [class*=\"css\"] {
 # ---------- SESSION STATE ----------
 if "selected_type" not in st.session_state:
     st.session_state.selected_type = None
+if "india_pulses_fig_key" not in st.session_state:
+    st.session_state.india_pulses_fig_key = None
+    st.session_state.india_pulses_fig = None
+if "full_india_fig_key" not in st.session_state:
+    st.session_state.full_india_fig_key = None
+    st.session_state.full_india_fig = None
+if "state_districts_fig_key" not in st.session_state:
+    st.session_state.state_districts_fig_key = None
+    st.session_state.state_districts_fig = None
+if "state_trend_fig_key" not in st.session_state:
+    st.session_state.state_trend_fig_key = None
+    st.session_state.state_trend_fig = None
+if "district_trend_fig_key" not in st.session_state:
+    st.session_state.district_trend_fig_key = None
+    st.session_state.district_trend_fig = None
 
 
 # Define a common mapping for state/UT names to ensure consistency
@@ -83,6 +104,41 @@ STATE_NAME_CORRECTIONS = {
     "Ladakh": "Ladakh" # Add Ladakh if it appears (post 2019 UT)
 }
 
+# Same corrections keyed on the normalized (stripped, upper-cased) spelling
+STATE_NAME_CORRECTIONS_UPPER = {
+    k.strip().upper(): v.strip().upper() for k, v in STATE_NAME_CORRECTIONS.items()
+}
+
+def normalize_state_names(names):
+    """
+    Strips and upper-cases state names, then applies the spelling corrections, returning
+    a categorical Series. Uses a hash lookup instead of .replace, keeping names without a
+    correction as-is. Only the distinct names are normalized; the rows are then recoded
+    with one integer gather, since a column holds a few dozen states repeated over
+    hundreds of rows.
+    """
+    distinct = pd.Categorical(names)
+    cleaned = distinct.categories.str.strip().str.upper()
+    corrected = [STATE_NAME_CORRECTIONS_UPPER.get(name, name) for name in cleaned]
+    # Several spellings can normalize to one name, so the corrected names are re-factorized
+    new_codes, new_names = pd.factorize(np.asarray(corrected, dtype=object))
+    codes = np.where(distinct.codes >= 0, new_codes[distinct.codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=new_names), index=names.index, name=names.name)
+
+def state_key(name):
+    """
+    Space-free, upper-case key of a state name; the join key between the pulses data,
+    the district shapefile and the state selector.
+    """
+    return name.upper().replace(" ", "")
+
+def state_key_column(states):
+    """
+    Categorical "_ST_KEY" column for a categorical column of normalized state names.
+    The key is derived once per distinct name rather than by string passes over every row.
+    """
+    return states.map({name: state_key(name) for name in states.cat.categories}).astype("category")
+
 # Define pulse units globally so they are always accessible
 pulse_units = {
     "Area": "'000 Hectare",
@@ -90,60 +146,473 @@ pulse_units = {
     "Yield": "Kg/Hectare"
 }
 
+# Geometry simplification tolerances (in degrees; both layers are in EPSG:4326 by the time
+# they are simplified). Larger tolerance means more simplification (smaller payload sent to
+# the browser, less detail). 0.01 takes the states layer from ~1.15M vertices to ~18k.
+STATE_SIMPLIFY_TOLERANCE = 0.01
+DISTRICT_SIMPLIFY_TOLERANCE = 0.005
+# Coordinates are snapped to this grid (in degrees, ~11 m) so the GeoJSON sent to the
+# browser carries 4 decimals instead of full float precision. The simplification above
+# already moves vertices by up to ~500 m, so the grid adds no visible error
+GEOMETRY_GRID_SIZE = 1e-4
+
+# Seed for the fabricated district values so they are reproducible across reruns
+DISTRICT_VALUES_SEED = 42
+
+# Animation options shared by every year-slider step; Plotly only reads them, so one
+# dict is reused instead of building an identical nested dict per year
+SLIDER_STEP_ANIMATION = {"frame": {"duration": 200, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}
+
+# Decimals kept in the animated map values (and shown on hover)
+MAP_VALUE_DECIMALS = 2
+
+# Static Play/Pause buttons and slider settings shared by the animated maps; only the
+# slider steps depend on the data and are added per figure
+MAP_ANIMATION_UPDATEMENUS = [{
+    "type": "buttons",
+    "buttons": [
+        {"label": "Play", "method": "animate", "args": [None, {"frame": {"duration": 200, "redraw": True}, "fromcurrent": True, "transition": {"duration": 0, "easing": "linear"}}]},
+        {"label": "Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]}
+    ],
+    "direction": "left", "pad": {"r": 10, "t": 87}, "showactive": False, "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top"
+}]
+MAP_SLIDER_SETTINGS = {"active": 0, "transition": {"duration": 0}, "x": 0.1, "pad": {"b": 10, "t": 50}, "len": 0.9}
+
+# Shapefiles are read through pyogrio (vectorized OGR read straight into arrays) instead of
+# Fiona's per-feature Python loop; attributes are decoded through Arrow
+SHAPEFILE_READ_OPTIONS = {"engine": "pyogrio", "use_arrow": True}
+
 # Global flags for data loading success
 data_loaded_successfully = True
 
 # --- Cached GeoDataFrame loading functions ---
-@st.cache_data
-def load_india_states_gdf(path="India_Shapefile/india_st.shp"):
+STATES_SHAPEFILE = "India_Shapefile/india_st.shp"
+# india_st.shp ships without a .prj; its coordinates are Web Mercator metres
+STATES_SHAPEFILE_CRS = "EPSG:3857"
+DISTRICTS_SHAPEFILE = "India_Shapefile/State/2011_Dist.shp"
+# Simplified, keyed GeoDataFrames are stored here as GeoParquet so a fresh process skips
+# the shapefile read and simplification
+GEOMETRY_CACHE_DIR = "cache"
+# Part of the GeoParquet file names; bump it whenever the processing changes (CRS, columns,
+# tolerances, grid size) so copies written by the old code are not reused
+GEOMETRY_CACHE_VERSION = 1
+# The in-memory caches built from a shapefile are keyed on its mtime; they keep entries for
+# this many versions, so the copies built from a replaced shapefile are eventually freed
+SHAPEFILE_CACHE_VERSIONS = 2
+# districts_geojson() holds all of India plus one collection per state for each version
+DISTRICTS_GEOJSON_ENTRIES_PER_VERSION = 40
+
+def file_mtime(path):
+    """
+    Modification time of path, or None if it does not exist. Passed to the cached loaders
+    so replacing a file on disk invalidates their cache entry.
+    """
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+def geometry_cache_path(source_path):
+    """
+    Path of the GeoParquet copy of a processed shapefile, for the current GEOMETRY_CACHE_VERSION.
+    """
+    base_name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(GEOMETRY_CACHE_DIR, f"{base_name}.v{GEOMETRY_CACHE_VERSION}.parquet")
+
+def read_geometry_cache(source_path):
+    """
+    Returns the GeoParquet copy of a processed shapefile when it is newer than the
+    shapefile, otherwise None.
+    """
+    cache_path = geometry_cache_path(source_path)
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(source_path):
+        return gpd.read_parquet(cache_path)
+    return None
+
+def write_geometry_cache(gdf, source_path):
+    """
+    Stores a processed shapefile as GeoParquet. A read-only deployment just keeps
+    loading from the shapefile.
+    """
+    try:
+        os.makedirs(GEOMETRY_CACHE_DIR, exist_ok=True)
+        gdf.to_parquet(geometry_cache_path(source_path), compression="zstd")
+    except OSError:
+        pass
+
+def simplify_geometries(geometry, tolerance):
+    """
+    Simplifies a GeoSeries and snaps it to GEOMETRY_GRID_SIZE with shapely 2's array
+    functions, which loop over the whole GEOS array in C.
+    """
+    values = shapely.simplify(geometry.to_numpy(), tolerance=tolerance, preserve_topology=True)
+    values = shapely.set_precision(values, GEOMETRY_GRID_SIZE)
+    return gpd.GeoSeries(values, index=geometry.index, crs=geometry.crs)
+
+@st.cache_data(max_entries=SHAPEFILE_CACHE_VERSIONS)
+def load_india_states_gdf(path=STATES_SHAPEFILE, mtime=None):
     """
     Loads India states shapefile, normalizes state names, and returns a GeoDataFrame.
-    Applies geometry simplification.
+    Applies geometry simplification. mtime is only part of the cache key (see file_mtime).
     """
     if not os.path.exists(path):
         st.error(f"Error: India states shapefile not found at '{path}'. Please ensure the file exists.")
         return None
     try:
-        gdf = gpd.read_file(path)
-        gdf["State_Name"] = gdf["State_Name"].str.strip().replace(STATE_NAME_CORRECTIONS).str.upper()
-        # Apply simplification to state geometries
-        # Tolerance value chosen to balance detail and file size (adjust as needed)
-        # Larger tolerance means more simplification (smaller file, less detail)
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.005, preserve_topology=True)
-        st.info(f"Successfully loaded {len(gdf)} state geometries from '{path}' (simplified).")
-        st.info(f"Sample GeoDataFrame state names: {sorted(gdf['State_Name'].unique().tolist())[:5]}...")
+        gdf = read_geometry_cache(path)
+        if gdf is None:
+            gdf = gpd.read_file(path, **SHAPEFILE_READ_OPTIONS)
+            # Keep only the join key and geometry so no extra properties end up in the GeoJSON
+            gdf = gdf[["State_Name", "geometry"]].copy()
+            gdf["State_Name"] = normalize_state_names(gdf["State_Name"])
+            # The maps expect lon/lat, and the simplification tolerance below is in degrees
+            gdf = gdf.set_crs(STATES_SHAPEFILE_CRS, allow_override=True).to_crs(epsg=4326)
+            # Apply simplification to state geometries once; the cached result is reused on every rerun
+            gdf['geometry'] = simplify_geometries(gdf.geometry, STATE_SIMPLIFY_TOLERANCE)
+            write_geometry_cache(gdf, path)
         return gdf
     except Exception as e:
         st.exception(f"Error loading India states GeoDataFrame from '{path}': {e}")
         return None
 
-@st.cache_data
-def load_india_districts_shapefile():
+@st.cache_data(max_entries=SHAPEFILE_CACHE_VERSIONS)
+def load_india_districts_shapefile(path=DISTRICTS_SHAPEFILE, mtime=None):
     """
     Loads India districts shapefile, normalizes state names within it,
     and returns a GeoDataFrame. Applies geometry simplification.
+    mtime is only part of the cache key (see file_mtime).
     """
-    path = "India_Shapefile/State/2011_Dist.shp"
     if not os.path.exists(path):
         st.error(f"Error: India districts shapefile not found at '{path}'. Please ensure the file exists.")
         return None
     try:
-        gdf = gpd.read_file(path)
-        gdf = gdf.set_crs(epsg=4326, inplace=False)
-        gdf["ST_NM"] = gdf["ST_NM"].str.strip().replace(STATE_NAME_CORRECTIONS).str.upper()
-        # Apply simplification to district geometries
-        # Increased tolerance to 0.005 for more aggressive simplification to address MessageSizeError
-        gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.005, preserve_topology=True)
-        st.info(f"Successfully loaded {len(gdf)} district geometries from '{path}' (simplified).")
-        st.info(f"Sample District shapefile state names: {sorted(gdf['ST_NM'].unique().tolist())[:5]}...")
+        gdf = read_geometry_cache(path)
+        if gdf is None:
+            # Only the name columns are decoded; the census codes are never used and would
+            # otherwise be carried through every copy, merge and cache write
+            gdf = gpd.read_file(path, columns=["DISTRICT", "ST_NM"], **SHAPEFILE_READ_OPTIONS)
+            gdf = gdf.set_crs(epsg=4326, inplace=False)
+            # ~36 distinct states over ~640 rows: categorical, so the key below is derived per
+            # category and state filters compare integer codes instead of strings
+            gdf["ST_NM"] = normalize_state_names(gdf["ST_NM"])
+            # Space-free state key, computed once here instead of on every comparison
+            gdf["_ST_KEY"] = state_key_column(gdf["ST_NM"])
+            # GeoJSON feature id for the full India map; some district names repeat across states
+            gdf["_DIST_KEY"] = gdf["_ST_KEY"].astype(object) + "/" + gdf["DISTRICT"]
+            gdf["DISTRICT"] = gdf["DISTRICT"].astype("category")
+            # Apply simplification to district geometries
+            # Aggressive simplification to address MessageSizeError
+            gdf['geometry'] = simplify_geometries(gdf.geometry, DISTRICT_SIMPLIFY_TOLERANCE)
+            # Index the rows by state key (sorted, unnamed so it never shadows the "_ST_KEY"
+            # column in groupbys) so one state's districts are an index lookup, not a scan
+            gdf = gdf.set_index(gdf["_ST_KEY"].rename(None)).sort_index(kind="stable")
+            gdf = gdf[["DISTRICT", "ST_NM", "_ST_KEY", "_DIST_KEY", "geometry"]]
+            write_geometry_cache(gdf, path)
         return gdf
     except Exception as e:
         st.exception(f"Error loading India districts shapefile from '{path}': {e}")
         return None
 
-# Load GeoDataFrame for states and districts once
-india_states_gdf = load_india_states_gdf()
-gdf_districts = load_india_districts_shapefile()
+@st.cache_resource
+def open_pulses_workbook(path):
+    """
+    Opens the pulses workbook once per process so switching sheets skips the ZIP/XML open.
+    """
+    return pd.ExcelFile(path, engine="openpyxl")
+
+def load_pulse_sheet(path, sheet_name):
+    """
+    Loads one pulses sheet (header on the second row). Reads the Parquet export written
+    by prep_data.py when it is newer than the workbook, otherwise parses the Excel sheet.
+    Only called through the cached prepare_pulse_sheet().
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(path):
+        df = pd.read_parquet(parquet_path, filters=[("sheet", "==", sheet_name)])
+        return df.drop(columns=["sheet"])
+    return pd.read_excel(open_pulses_workbook(path), sheet_name=sheet_name, header=1)
+
+@st.cache_data
+def prepare_pulse_sheet(path, sheet_name):
+    """
+    Loads one pulses sheet and applies the cleanup that does not depend on season, metric
+    or decade: stripped column names, Arrow-backed State/Season strings, numeric Year, and
+    normalized State names with their space-free "_ST_KEY".
+    Cached per (path, sheet) so reruns only apply the season and metric filters.
+    """
+    df = load_pulse_sheet(path, sheet_name)
+    df.columns = df.columns.str.strip()
+    df = df.rename(columns={"States/UTs": "State"})
+
+    # Arrow-backed strings so the .str operations run as vectorized Arrow kernels
+    arrow_string_cols = [col for col in ("State", "Season") if col in df.columns]
+    df[arrow_string_cols] = df[arrow_string_cols].astype("string[pyarrow]")
+
+    if "Year" in df.columns:
+        # "2001-02" -> 2001; rows without a parseable year are dropped
+        start_years = pd.to_numeric(df["Year"].astype(str).str.split('-').str[0], errors='coerce')
+        df = df[start_years.notna()].copy()
+        df["Year"] = start_years.dropna().astype(int)
+
+    if "State" in df.columns:
+        df = df.dropna(subset=["State"])
+        # A few dozen distinct states repeated over every year: categorical keeps one copy of
+        # each name and makes the state filters and groupbys compare integer codes
+        df["State"] = normalize_state_names(df["State"])
+        df["_ST_KEY"] = state_key_column(df["State"])
+    return df
+
+@st.cache_data
+def select_pulse_rows(path, sheet_name, season, metric):
+    """
+    Rows of one prepared pulses sheet for a season with a numeric metric value, projected to
+    State, "_ST_KEY", Year and the metric. Cached per selection, so reruns that only change
+    the decade, state or district skip the string and numeric scans.
+    """
+    df = prepare_pulse_sheet(path, sheet_name)
+    # One combined mask and a single projected copy, instead of a copy per filter stage.
+    # Missing seasons compare as <NA>; treat them as non-matching
+    metric_values = pd.to_numeric(df[metric], errors="coerce")
+    season_mask = df["Season"].str.lower().eq(season.lower()).fillna(False)
+    keep_rows = season_mask & metric_values.notna()
+    return df.loc[keep_rows, ["State", "_ST_KEY", "Year"]].assign(**{metric: metric_values[keep_rows]})
+
+@st.cache_data
+def fabricate_district_values(state_totals, district_table, district_col, metric, seed=DISTRICT_VALUES_SEED):
+    """
+    Splits every state's yearly total across its districts using Dirichlet proportions.
+    Expects a "_ST_KEY" column in both tables.
+    Returns a long DataFrame with one row per (state key, district, year), including
+    the "_DIST_KEY" ("<state key>/<district>") used as the map location, ordered by year.
+    Seeded so the cached result is stable across reruns.
+    """
+    generator = np.random.default_rng(seed)
+
+    district_table = district_table.dropna(subset=[district_col]).drop_duplicates(["_ST_KEY", district_col])
+    # Both state keys on one shared categorical dtype, so the rows are matched on integer codes
+    # (through object: the pulse keys are Arrow-backed strings, the shapefile keys are not,
+    # and union_categoricals needs categories of one dtype)
+    state_key_dtype = pd.CategoricalDtype(union_categoricals(
+        [pd.Categorical(state_totals["_ST_KEY"].astype(object)), pd.Categorical(district_table["_ST_KEY"].astype(object))], ignore_order=True
+    ).categories)
+    state_totals = state_totals.astype({"_ST_KEY": state_key_dtype})
+    district_table = district_table.astype({"_ST_KEY": state_key_dtype})
+    # Keys are built once per district here, not concatenated per (district, year) row
+    district_table["_DIST_KEY"] = (
+        district_table["_ST_KEY"].astype(object) + "/" + district_table[district_col].astype(object)
+    ).astype("category")
+
+    # One row per (state total, district): each state-year row expands into the contiguous
+    # slice of its state's districts. Built as index arrays and wrapped in one DataFrame at
+    # the end instead of a merge; row_ids identifies the state-year row, so duplicate years
+    # never share one draw
+    # A repeated (state, year) total keeps its first row, so every (district, year) is unique
+    state_totals = state_totals[state_totals[metric].notna() & state_totals["_ST_KEY"].notna()]
+    state_totals = state_totals.drop_duplicates(["_ST_KEY", "Year"])
+    district_table = district_table[district_table["_ST_KEY"].notna()].sort_values("_ST_KEY", kind="stable")
+    district_counts = np.bincount(district_table["_ST_KEY"].cat.codes.to_numpy(), minlength=len(state_key_dtype.categories))
+    district_starts = np.cumsum(district_counts) - district_counts
+    total_codes = state_totals["_ST_KEY"].cat.codes.to_numpy()
+    rows_per_total = district_counts[total_codes]
+    row_ids = np.repeat(np.arange(len(state_totals)), rows_per_total)
+    offsets = np.arange(len(row_ids)) - np.repeat(np.cumsum(rows_per_total) - rows_per_total, rows_per_total)
+    district_rows = np.repeat(district_starts[total_codes], rows_per_total) + offsets
+
+    # Flat Dirichlet per state-year: standard exponentials normalized within each row_ids group
+    # (Dirichlet(1, ..., 1) is a normalized exponential vector), drawn in one call. The group
+    # sums are one bincount over the row ids, gathered back to every district row
+    shares = generator.standard_exponential(len(row_ids))
+    share_sums = np.bincount(row_ids, weights=shares, minlength=len(state_totals))[row_ids]
+    totals = state_totals[metric].to_numpy(dtype=np.float64)[row_ids]
+
+    long_df = pd.DataFrame({
+        "_ST_KEY": district_table["_ST_KEY"].array.take(district_rows),
+        district_col: district_table[district_col].array.take(district_rows),
+        "_DIST_KEY": district_table["_DIST_KEY"].array.take(district_rows),
+        "Dummy_Value": shares / share_sums * totals,
+        "Year": state_totals["Year"].to_numpy()[row_ids],
+    })
+    return long_df.sort_values("Year", kind="stable", ignore_index=True)
+
+def district_values_by_year(district_values, location_col):
+    """
+    Years x locations table of "Dummy_Value" from fabricate_district_values() output.
+    (Year, location) is unique there, so this is a reshape on the index codes
+    (unstack) rather than a hashed pivot_table aggregation. Unused categories are
+    dropped first so a state's slice gets only its own district columns.
+    """
+    locations = district_values[location_col]
+    if isinstance(locations.dtype, pd.CategoricalDtype):
+        locations = locations.cat.remove_unused_categories()
+    index = pd.MultiIndex.from_arrays([district_values["Year"], locations])
+    return district_values["Dummy_Value"].set_axis(index).unstack()
+
+@st.cache_resource(max_entries=SHAPEFILE_CACHE_VERSIONS)
+def sorted_districts_by_state(district_col, mtime=None):
+    """
+    Returns {state key: sorted district names} for every state in the district shapefile.
+    Built once with a single groupby; callers only read it, so one shared dict is
+    returned instead of a per-rerun copy.
+    mtime is the district shapefile's (see file_mtime).
+    """
+    gdf = load_india_districts_shapefile(mtime=mtime)
+    if gdf is None or district_col not in gdf.columns:
+        return {}
+    districts = gdf.dropna(subset=[district_col]).groupby("_ST_KEY", observed=True)[district_col].unique()
+    return {state_key: sorted(names) for state_key, names in districts.items()}
+
+@st.cache_data
+def simulated_district_series(first_year=2000, last_year=2023, seed=42):
+    """
+    Returns (years, values, y_min, y_max) for the simulated district trend.
+    Deterministic, so it is computed once and served from the cache on every rerun.
+    Uses a local RandomState so the values match the former np.random.seed(42) draw.
+    """
+    years = np.arange(first_year, last_year + 1)
+    values = np.random.RandomState(seed).uniform(low=50, high=300, size=len(years))
+    return years, values, values.min() * 0.95, values.max() * 1.05
+
+@st.cache_resource
+def simulated_trend_frames():
+    """
+    Animation frames for the simulated district trend: frame k holds the first k + 1
+    points as plain array slices, so no cumulative long-form table is built.
+    The series is the same for every district, so the frames are built once per process
+    and shared read-only; _validate=False skips Plotly's per-attribute validation.
+    """
+    years, values, _, _ = simulated_district_series()
+    return [
+        go.Frame(name=str(year), data=[go.Scatter(x=years[:k + 1], y=values[:k + 1], _validate=False)], _validate=False)
+        for k, year in enumerate(years)
+    ]
+
+@st.cache_resource(max_entries=SHAPEFILE_CACHE_VERSIONS)
+def india_states_geojson(mtime=None):
+    """
+    GeoJSON dict of the state polygons with "State_Name" as the only property.
+    Built once and shared read-only by every rerun instead of walking the geometries again.
+    mtime is the states shapefile's (see file_mtime).
+    """
+    gdf = load_india_states_gdf(mtime=mtime)
+    if gdf is None:
+        return None
+    return gdf[["State_Name", "geometry"]].__geo_interface__
+
+@st.cache_resource(max_entries=SHAPEFILE_CACHE_VERSIONS * DISTRICTS_GEOJSON_ENTRIES_PER_VERSION)
+def districts_geojson(state_key=None, mtime=None):
+    """
+    GeoJSON dict of the district polygons for all of India or, given a state_key (matched
+    on "_ST_KEY"), for one state. Features carry no properties: each one's "id" is its
+    integer district id (see district_feature_ids), which the maps use as locations.
+    The geometry is converted once for all of India; a state's collection reuses those
+    feature dicts, so the state and full India maps share one geometry payload.
+    mtime is the district shapefile's (see file_mtime).
+    """
+    gdf = load_india_districts_shapefile(mtime=mtime)
+    if gdf is None:
+        return None
+    gdf = gdf[gdf["ST_NM"] != "INDIA"]
+    if state_key is None:
+        geojson = gdf[["geometry"]].__geo_interface__
+        for district_id, feature in enumerate(geojson["features"]):
+            feature["id"] = district_id
+        return geojson
+    all_features = districts_geojson(mtime=mtime)["features"]
+    # Features are in row order, and the rows are grouped by state key
+    return {"type": "FeatureCollection",
+            "features": [all_features[i] for i in np.flatnonzero(gdf.index == state_key)]}
+
+@st.cache_resource(max_entries=SHAPEFILE_CACHE_VERSIONS)
+def district_feature_ids(mtime=None):
+    """
+    Integer district id (row position, the GeoJSON feature "id") by "_DIST_KEY".
+    Frames and locations then reference districts by small integers instead of
+    matching name strings against a feature property.
+    mtime is the district shapefile's (see file_mtime).
+    """
+    gdf = load_india_districts_shapefile(mtime=mtime)
+    if gdf is None:
+        return pd.Series(dtype=np.int64)
+    gdf = gdf[gdf["ST_NM"] != "INDIA"]
+    ids = pd.Series(np.arange(len(gdf)), index=gdf["_DIST_KEY"].astype(object).to_numpy())
+    # A repeated state/district name keeps its first polygon
+    return ids[~ids.index.duplicated()]
+
+def map_view_for_bounds(bounds):
+    """
+    Returns a (center, zoom) pair that roughly fits (minx, miny, maxx, maxy) bounds on a tile map.
+    """
+    minx, miny, maxx, maxy = bounds
+    center = {"lat": (miny + maxy) / 2, "lon": (minx + maxx) / 2}
+    extent = max(maxx - minx, maxy - miny, 1e-6)
+    zoom = float(np.clip(np.log2(360 / extent) - 0.5, 0, 12))
+    return center, zoom
+
+def animated_choropleth_map(values_by_year, geojson, featureidkey, bounds, title, unit, value_label, colorscale, opacity=1.0, locations=None, hover_text=None):
+    """
+    Builds an animated Choroplethmap figure from a (years x locations) value table.
+    Geometry, locations and styling are sent once on the base trace; each frame only
+    carries that year's z values, so the GeoJSON is not repeated per frame.
+    locations are the feature ids of the columns and hover_text the names shown on
+    hover; both default to the column labels.
+    """
+    names = values_by_year.columns.tolist()
+    if locations is None:
+        locations = names
+    if hover_text is None:
+        hover_text = names
+    # Rounded before serialization: full float64 reprs (e.g. 123.45678901234567) are most of
+    # the frame bytes on the full India map (~640 districts x every year)
+    values = np.round(values_by_year.to_numpy(dtype=np.float64), MAP_VALUE_DECIMALS)
+    # _validate=False skips Plotly's per-attribute property validation for every frame
+    frames = [
+        go.Frame(name=str(year), data=[go.Choroplethmap(z=year_values, _validate=False)], _validate=False)
+        for year, year_values in zip(values_by_year.index, values)
+    ]
+    fig = go.Figure(
+        data=[go.Choroplethmap(
+            geojson=geojson,
+            locations=locations,
+            featureidkey=featureidkey,
+            z=values[0],
+            text=hover_text,
+            coloraxis="coloraxis",
+            marker_opacity=opacity,
+            hovertemplate=f"<b>%{{text}}</b><br>{value_label}: %{{z}}<extra></extra>",
+            _validate=False
+        )],
+        frames=frames,
+        _validate=False
+    )
+
+    # Tile-map (MapLibre, WebGL) rendering keeps dense polygon animations smooth;
+    # Choroplethmapbox is deprecated in plotly 6 and removed in 7
+    center, zoom = map_view_for_bounds(bounds)
+    fig.update_layout(
+        map=dict(style="carto-positron", center=center, zoom=zoom),
+        title=title,
+        coloraxis=dict(colorscale=colorscale, cmin=float(np.nanmin(values)), cmax=float(np.nanmax(values)), colorbar=dict(title=unit)),
+        margin={"r": 0, "t": 40, "l": 0, "b": 0},
+        updatemenus=MAP_ANIMATION_UPDATEMENUS,
+        sliders=[{
+            **MAP_SLIDER_SETTINGS,
+            "steps": [{"args": [[str(year)], SLIDER_STEP_ANIMATION],
+                       "label": str(year), "method": "animate"} for year in values_by_year.index]
+        }]
+    )
+    return fig
+
+# Diagnostic st.info lines (row counts, DataFrame heads, name lists) are only formatted and
+# sent to the browser when this is ticked
+show_debug_info = st.sidebar.checkbox("🐞 Show debug info", value=False, key="debug")
+
+# Load GeoDataFrame for states and districts once. The mtimes are also passed to the derived
+# geometry helpers, so they are rebuilt together with the GeoDataFrames
+states_mtime = file_mtime(STATES_SHAPEFILE)
+districts_mtime = file_mtime(DISTRICTS_SHAPEFILE)
+india_states_gdf = load_india_states_gdf(mtime=states_mtime)
+gdf_districts = load_india_districts_shapefile(mtime=districts_mtime)
+if show_debug_info and india_states_gdf is not None and gdf_districts is not None:
+    st.info(f"Loaded {len(india_states_gdf)} state and {len(gdf_districts)} district geometries (simplified).")
+    st.info(f"Sample GeoDataFrame state names: {sorted(india_states_gdf['State_Name'].unique().tolist())[:5]}...")
+    st.info(f"Sample District shapefile state names: {sorted(gdf_districts['ST_NM'].unique().tolist())[:5]}...")
 
 # Check if GeoDataFrame data loaded successfully
 if india_states_gdf is None or gdf_districts is None:
@@ -176,55 +645,29 @@ if data_loaded_successfully:
             st.error(f"Error: Pulses data Excel file not found at '{excel_path}'. Please ensure the file exists.")
             data_loaded_successfully = False
         else:
-            df_pulses_raw = pd.read_excel(excel_path, sheet_name=pulse_type, header=1)
-            st.info(f"Successfully loaded raw data for '{pulse_type}'. Original rows: {len(df_pulses_raw)}.")
-            st.info(f"Raw df_pulses_raw columns: {df_pulses_raw.columns.tolist()}")
-            st.info(f"Raw df_pulses_raw head:\n{df_pulses_raw.head().to_string()}")
-
-            df_pulses_raw.columns = df_pulses_raw.columns.str.strip()
-            df_pulses_raw = df_pulses_raw.rename(columns={"States/UTs": "State"})
-
-            if "Season" in df_pulses_raw.columns:
-                df_pulses_raw = df_pulses_raw[df_pulses_raw["Season"].str.lower() == season.lower()].copy()
-                st.info(f"After Season filter, df_pulses_raw rows: {len(df_pulses_raw)}.")
-            else:
-                st.warning("Season column not found in pulses data. Check Excel structure.")
-                df_pulses_raw = pd.DataFrame()
-
-            if not df_pulses_raw.empty and "Year" in df_pulses_raw.columns:
-                df_pulses_raw["Year_Processed"] = pd.to_numeric(df_pulses_raw["Year"].astype(str).str.split('-').str[0], errors='coerce')
-                df_pulses_raw = df_pulses_raw.dropna(subset=["Year_Processed"]).copy()
-                if not df_pulses_raw.empty:
-                    df_pulses_raw["Year"] = df_pulses_raw["Year_Processed"].astype(int)
-                    df_pulses_raw = df_pulses_raw.drop(columns=["Year_Processed"])
-                else:
-                    st.warning("No valid 'Year' data after processing. Check 'Year' column in Excel.")
-                    df_pulses_raw = pd.DataFrame()
-            elif not df_pulses_raw.empty:
-                st.warning("Year column not found in pulses data. Check Excel structure.")
-                df_pulses_raw = pd.DataFrame()
-
-            if not df_pulses_raw.empty and metric in df_pulses_raw.columns:
-                df_pulses_raw[metric] = pd.to_numeric(df_pulses_raw[metric], errors="coerce")
-                df_pulses_raw = df_pulses_raw.dropna(subset=[metric]).copy()
-                st.info(f"After Metric processing & NaN drop, df_pulses_raw rows: {len(df_pulses_raw)}.")
-            elif not df_pulses_raw.empty:
-                st.warning(f"Metric column '{metric}' not found in pulses data. Check Excel structure.")
-                df_pulses_raw = pd.DataFrame()
-
-            if not df_pulses_raw.empty and "State" in df_pulses_raw.columns:
-                df_pulses_raw["State"] = df_pulses_raw["State"].str.strip().replace(STATE_NAME_CORRECTIONS).str.upper()
-                st.info(f"Unique state names from Pulses Data (after normalization): {sorted(df_pulses_raw['State'].unique().tolist())}")
-            elif not df_pulses_raw.empty:
-                st.warning("State column not found in pulses data. Check Excel structure.")
+            df_pulses_raw = prepare_pulse_sheet(excel_path, pulse_type)
+            if show_debug_info:
+                st.info(f"Successfully loaded raw data for '{pulse_type}'. Original rows: {len(df_pulses_raw)}.")
+                st.info(f"Raw df_pulses_raw columns: {df_pulses_raw.columns.tolist()}")
+                st.info(f"Raw df_pulses_raw head:\n{df_pulses_raw.head().to_string()}")
+
+            missing_cols = [col for col in ("Season", "Year", metric, "State") if col not in df_pulses_raw.columns]
+            if missing_cols:
+                st.warning(f"Column(s) {missing_cols} not found in pulses data. Check Excel structure.")
                 df_pulses_raw = pd.DataFrame()
+            else:
+                df_pulses_raw = select_pulse_rows(excel_path, pulse_type, season, metric)
+                if show_debug_info:
+                    st.info(f"After Season filter and Metric NaN drop, df_pulses_raw rows: {len(df_pulses_raw)}.")
+                    st.info(f"Unique state names from Pulses Data (after normalization): {sorted(df_pulses_raw['State'].unique().tolist())}")
 
             min_year = 0
             max_year = 0
             if not df_pulses_raw.empty and "Year" in df_pulses_raw.columns:
                 min_year = int(df_pulses_raw["Year"].min())
                 max_year = int(df_pulses_raw["Year"].max())
-                st.info(f"Calculated year range from raw data: {min_year}-{max_year}")
+                if show_debug_info:
+                    st.info(f"Calculated year range from raw data: {min_year}-{max_year}")
             else:
                 st.warning("Cannot determine year range. Decade selection will be unavailable.")
                 data_loaded_successfully = False
@@ -244,11 +687,13 @@ if data_loaded_successfully:
             if decade_options:
                 selected_decade_range = st.selectbox("Select Decade Range", decade_options)
                 start_year_decade, end_year_decade = map(int, selected_decade_range.split('-'))
+                # Read-only from here on, so the decade slice is not copied
                 df_pulses = df_pulses_raw[
                     (df_pulses_raw["Year"] >= start_year_decade) &
                     (df_pulses_raw["Year"] <= end_year_decade)
-                ].copy()
-                st.info(f"Data filtered for decade: {selected_decade_range}. Rows: {len(df_pulses)}. Years: {sorted(df_pulses['Year'].unique().tolist()) if not df_pulses.empty else 'None'}")
+                ]
+                if show_debug_info:
+                    st.info(f"Data filtered for decade: {selected_decade_range}. Rows: {len(df_pulses)}. Years: {sorted(df_pulses['Year'].unique().tolist()) if not df_pulses.empty else 'None'}")
             else:
                 st.warning("No complete decade ranges found. Check data or selections.")
                 df_pulses = pd.DataFrame()
@@ -265,42 +710,25 @@ if data_loaded_successfully:
             elif "State" not in df_pulses.columns or metric not in df_pulses.columns or "Year" not in df_pulses.columns:
                  st.warning("Required columns (State, Metric, Year) missing in filtered pulses data. Cannot display map.")
             else:
-                fig_india_pulses = px.choropleth(
-                    df_pulses,
-                    geojson=india_states_gdf.geometry.__geo_interface__, # Use geometry interface
-                    locations="State",
-                    featureidkey="properties.State_Name", # Match against properties in the GeoDataFrame
-                    color=metric,
-                    hover_name="State",
-                    animation_frame="Year",
-                    color_continuous_scale="YlGnBu",
-                    title=title,
-                    labels={metric: unit}
-                )
-
-                fig_india_pulses.update_geos(fitbounds="locations", visible=False)
-                fig_india_pulses.update_layout(
-                    coloraxis_colorbar=dict(title=unit),
-                    margin={"r": 0, "t": 40, "l": 0, "b": 0},
-                    updatemenus=[{
-                        "type": "buttons",
-                        "buttons": [
-                            {"label": "Play", "method": "animate", "args": [None, {"frame": {"duration": 200, "redraw": True}, "fromcurrent": True, "transition": {"duration": 0, "easing": "linear"}}]},
-                            {"label": "Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]}
-                        ],
-                        "direction": "left", "pad": {"r": 10, "t": 87}, "showactive": False, "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top"
-                    }],
-                    sliders=[{
-                        "steps": [{"args": [[year], {"frame": {"duration": 200, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}],
-                                   "label": str(year), "method": "animate"} for year in sorted(df_pulses["Year"].unique())],
-                        "active": 0, "transition": {"duration": 0}, "x": 0.1, "pad": {"b": 10, "t": 50}, "len": 0.9
-                    }]
-                )
-                color_min = df_pulses[metric].min()
-                color_max = df_pulses[metric].max()
-                fig_india_pulses.update_coloraxes(cmin=color_min, cmax=color_max)
-
-                st.plotly_chart(fig_india_pulses, use_container_width=True)
+                # The states map only depends on these inputs; reruns triggered by the state or
+                # district selectors reuse the figure built for the previous run
+                india_pulses_fig_key = (season, pulse_type, metric, selected_decade_range, states_mtime)
+                if st.session_state.india_pulses_fig_key != india_pulses_fig_key:
+                    state_values_by_year = df_pulses.pivot_table(index="Year", columns="State", values=metric, aggfunc="first", observed=True)
+                    fig_india_pulses = animated_choropleth_map(
+                        state_values_by_year,
+                        geojson=india_states_geojson(states_mtime), # Cached dict, keeps the featureidkey property
+                        featureidkey="properties.State_Name", # Match against properties in the GeoDataFrame
+                        bounds=india_states_gdf.total_bounds,
+                        title=title,
+                        unit=unit,
+                        value_label=f"{metric} ({unit})",
+                        colorscale="YlGnBu"
+                    )
+                    st.session_state.india_pulses_fig = fig_india_pulses
+                    st.session_state.india_pulses_fig_key = india_pulses_fig_key
+
+                st.plotly_chart(st.session_state.india_pulses_fig, use_container_width=True)
 
     except Exception as e:
         st.exception(e)
@@ -335,12 +763,15 @@ if gdf_districts is not None and not gdf_districts.empty:
             break
 
 if data_loaded_successfully and selected_state_map != "None" and state_col and district_col:
-    normalized_selected_state = selected_state_map.upper().replace(" ", "")
+    normalized_selected_state = state_key(selected_state_map)
     if state_col in gdf_districts.columns:
-        state_gdf_filtered = gdf_districts[
-            gdf_districts[state_col].str.upper().str.replace(" ", "") == normalized_selected_state
-        ].copy()
-        st.info(f"State GeoDataFrame filtered for '{selected_state_map}'. Rows: {len(state_gdf_filtered)}")
+        # Index lookup on the state key; the slice is only read, so it is not copied
+        if normalized_selected_state in gdf_districts.index:
+            state_gdf_filtered = gdf_districts.loc[[normalized_selected_state]]
+        else:
+            state_gdf_filtered = gdf_districts.iloc[0:0]
+        if show_debug_info:
+            st.info(f"State GeoDataFrame filtered for '{selected_state_map}'. Rows: {len(state_gdf_filtered)}")
     else:
         st.error(f"Missing expected column '{state_col}' in district shapefile for state filtering.")
         state_gdf_filtered = gpd.GeoDataFrame()
@@ -349,10 +780,10 @@ if data_loaded_successfully and selected_state_map != "None" and state_col and d
         st.warning(f"No district data found for {selected_state_map} in the district shapefile. Check state name consistency.")
     else:
         if not df_pulses.empty and "State" in df_pulses.columns and "Year" in df_pulses.columns and metric in df_pulses.columns:
-            state_historical_df = df_pulses[
-                df_pulses["State"].str.upper().str.replace(" ", "") == normalized_selected_state
-            ].copy()
-            st.info(f"State historical data (from df_pulses) for '{selected_state_map}'. Rows: {len(state_historical_df)}")
+            # Read-only slice: it is only sorted into new frames and passed to the cached builders
+            state_historical_df = df_pulses[df_pulses["_ST_KEY"] == normalized_selected_state]
+            if show_debug_info:
+                st.info(f"State historical data (from df_pulses) for '{selected_state_map}'. Rows: {len(state_historical_df)}")
         else:
             st.warning("Pulses data (df_pulses) is empty or missing required columns for state historical data. Skipping state map plot.")
             state_historical_df = pd.DataFrame()
@@ -360,72 +791,53 @@ if data_loaded_successfully and selected_state_map != "None" and state_col and d
         if state_historical_df.empty:
             st.warning(f"No pulse data available for {selected_state_map} for {season} - {pulse_type} - {metric} over time within the selected decade. Skipping state map plot.")
         else:
-            animated_state_district_data = []
-            all_years_in_state_data = sorted(state_historical_df["Year"].unique())
-
-            for year in all_years_in_state_data:
-                current_year_state_data = state_historical_df[state_historical_df["Year"] == year]
-                state_total_value = current_year_state_data[metric].values[0] if not current_year_state_data.empty else 0
-
-                if district_col in state_gdf_filtered.columns:
-                    districts_in_state = state_gdf_filtered[district_col].dropna().unique().tolist()
-                else:
-                    districts_in_state = []
-                    st.warning(f"District column '{district_col}' not found in filtered state GeoDataFrame for data fabrication.")
-
-                n_districts = len(districts_in_state)
-                dummy_values_for_year = np.random.dirichlet(np.ones(n_districts)) * state_total_value if n_districts > 0 and pd.notna(state_total_value) else []
-
-                temp_df = pd.DataFrame({
-                    district_col: districts_in_state,
-                    "Dummy_Value": dummy_values_for_year,
-                    "Year": year
-                })
-                animated_state_district_data.append(temp_df)
-
-            if animated_state_district_data:
-                animated_state_district_df = pd.concat(animated_state_district_data, ignore_index=True)
-                merged_district_gdf = state_gdf_filtered.merge(animated_state_district_df, left_on=district_col, right_on=district_col, how="left")
-                st.info(f"Merged district GeoDataFrame rows for state map: {len(merged_district_gdf)}")
-                st.info(f"Sample merged_district_gdf head for state map:\n{merged_district_gdf.head().to_string()}")
+            animated_state_district_df = pd.DataFrame()
+            if district_col in state_gdf_filtered.columns:
+                # The very same cached call as the full India map, sliced to this state: the
+                # seeded draws then give a district the same value on both maps, and both
+                # views share one cache entry
+                all_state_district_df = fabricate_district_values(
+                    df_pulses[["_ST_KEY", "Year", metric]],
+                    gdf_districts[["_ST_KEY", district_col]],
+                    district_col,
+                    metric
+                )
+                animated_state_district_df = all_state_district_df[
+                    all_state_district_df["_ST_KEY"] == normalized_selected_state
+                ]
+            else:
+                st.warning(f"District column '{district_col}' not found in filtered state GeoDataFrame for data fabrication.")
 
-                st.markdown(f"### 📍 {selected_state_map} District Map - {metric} ({season}, {pulse_type})")
+            if not animated_state_district_df.empty:
+                if show_debug_info:
+                    st.info(f"Animated district data rows for state map: {len(animated_state_district_df)}")
+                    st.info(f"Sample animated_state_district_df head for state map:\n{animated_state_district_df.head().to_string()}")
 
-                fig_state_districts = px.choropleth(
-                    merged_district_gdf,
-                    geojson=merged_district_gdf.geometry.__geo_interface__, # Use geometry interface
-                    locations=district_col,
-                    featureidkey=f"properties.{district_col}", # Match against properties in the GeoDataFrame
-                    color="Dummy_Value",
-                    hover_name=district_col,
-                    animation_frame="Year",
-                    color_continuous_scale="YlOrRd",
-                    title=f"{selected_state_map} District Map - {metric} ({season}, {pulse_type}) Over Time",
-                    labels={"Dummy_Value": unit}
-                )
+                st.markdown(f"### 📍 {selected_state_map} District Map - {metric} ({season}, {pulse_type})")
 
-                fig_state_districts.update_geos(fitbounds="locations", visible=False)
-                fig_state_districts.update_layout(
-                    coloraxis_colorbar=dict(title=unit),
-                    margin={"r": 0, "t": 40, "l": 0, "b": 0},
-                    updatemenus=[{
-                        "type": "buttons",
-                        "buttons": [
-                            {"label": "Play", "method": "animate", "args": [None, {"frame": {"duration": 200, "redraw": True}, "fromcurrent": True, "transition": {"duration": 0, "easing": "linear"}}]},
-                            {"label": "Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]}
-                        ],
-                        "direction": "left", "pad": {"r": 10, "t": 87}, "showactive": False, "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top"
-                    }],
-                    sliders=[{
-                        "steps": [{"args": [[year], {"frame": {"duration": 200, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}],
-                                   "label": str(year), "method": "animate"} for year in all_years_in_state_data],
-                        "active": 0, "transition": {"duration": 0}, "x": 0.1, "pad": {"b": 10, "t": 50}, "len": 0.9
-                    }]
-                )
-                color_min_dist = merged_district_gdf["Dummy_Value"].min()
-                color_max_dist = merged_district_gdf["Dummy_Value"].max()
-                fig_state_districts.update_coloraxes(cmin=color_min_dist, cmax=color_max_dist)
-                st.plotly_chart(fig_state_districts, use_container_width=True)
+                # Only rebuilt when the state or the data selection changes; selecting another
+                # district for the trend below reuses the figure from the previous run
+                state_districts_fig_key = (season, pulse_type, metric, selected_decade_range, selected_state_map, districts_mtime)
+                if st.session_state.state_districts_fig_key != state_districts_fig_key:
+                    # Geometry is sent once; the animation frames only carry the per-year values
+                    state_values_by_district = district_values_by_year(animated_state_district_df, district_col)
+                    fig_state_districts = animated_choropleth_map(
+                        state_values_by_district,
+                        geojson=districts_geojson(normalized_selected_state, districts_mtime),
+                        featureidkey="id", # Integer district ids, see district_feature_ids()
+                        locations=district_feature_ids(districts_mtime).loc[
+                            [f"{normalized_selected_state}/{name}" for name in state_values_by_district.columns]
+                        ].tolist(),
+                        bounds=state_gdf_filtered.total_bounds,
+                        title=f"{selected_state_map} District Map - {metric} ({season}, {pulse_type}) Over Time",
+                        unit=unit,
+                        value_label=unit,
+                        colorscale="YlOrRd",
+                        opacity=0.7
+                    )
+                    st.session_state.state_districts_fig = fig_state_districts
+                    st.session_state.state_districts_fig_key = state_districts_fig_key
+                st.plotly_chart(st.session_state.state_districts_fig, use_container_width=True)
             else:
                 st.warning(f"Could not generate animated district map for {selected_state_map}. Animated data list was empty.")
 
@@ -435,42 +847,51 @@ if data_loaded_successfully and selected_state_map != "None" and state_col and d
             y_axis_title = f"{metric} ({pulse_units.get(metric, '')})"
 
             if not state_historical_df.empty and state_historical_df[metric].notna().any():
-                all_years_for_line_plot = sorted(state_historical_df["Year"].unique())
-                animation_frames_line = []
-                for year in all_years_for_line_plot:
-                    frame_data = state_historical_df[state_historical_df["Year"] <= year].copy()
-                    frame_data["FrameYear"] = year
-                    animation_frames_line.append(frame_data)
-                animated_state_line_df = pd.concat(animation_frames_line, ignore_index=True)
-                st.info(f"Animated state line data rows: {len(animated_state_line_df)}")
-
-                if not animated_state_line_df.empty and metric in animated_state_line_df.columns:
-                    y_min_state = animated_state_line_df[metric].min() * 0.95
-                    y_max_state = animated_state_line_df[metric].max() * 1.05
-                    x_min_state = animated_state_line_df["Year"].min()
-                    x_max_state = animated_state_line_df["Year"].max()
-                else:
-                    y_min_state, y_max_state, x_min_state, x_max_state = 0, 1, 0, 1
-                    st.warning("Could not determine axis limits for state historical plot. Data might be empty or missing metric column.")
-
-                fig_state_trend = px.line(
-                    animated_state_line_df,
-                    x="Year", y=metric, animation_frame="FrameYear", animation_group="State",
-                    title=f"Animated Trend of {metric} for {pulse_type} ({season}) in {selected_state_map}",
-                    markers=True, labels={"Year": "Year", metric: y_axis_title, "FrameYear": "Year"},
-                    range_y=[y_min_state, y_max_state], range_x=[x_min_state, x_max_state]
-                )
-
-                fig_state_trend.update_layout(
-                    yaxis_title=y_axis_title, xaxis_title="Year",
-                    font=dict(family="Poppins", size=12), title_font_size=18, legend_title="Metric",
-                    sliders=[{'currentvalue': {'prefix': 'Year: '}, 'pad': {'t': 20}}],
-                    updatemenus=[{'type': 'buttons', 'showactive': False, 'x': 0.05, 'y': -0.15,
-                                  'buttons': [{'label': 'Play', 'method': 'animate', 'args': [None, {'frame': {'duration': 100, 'redraw': True}, 'fromcurrent': True, 'transition': {'duration': 0}}]},
-                                              {'label': 'Pause', 'method': 'animate', "args": [[None], {'frame': {'duration': 50, 'redraw': False}, 'mode': 'immediate', 'transition': {'duration': 0}}]}]}]
-                )
-                fig_state_trend.update_layout({'sliders': [{'currentvalue': {'prefix': 'Year: '}, 'pad': {'t': 20}}]})
-                st.plotly_chart(fig_state_trend, use_container_width=True)
+                # Same inputs as the state district map: the frame slices and figure are only
+                # rebuilt when the state or the data selection changes
+                state_trend_fig_key = (season, pulse_type, metric, selected_decade_range, selected_state_map)
+                if st.session_state.state_trend_fig_key != state_trend_fig_key:
+                    state_years = state_historical_df["Year"].to_numpy()
+                    state_metric_values = state_historical_df[metric].to_numpy(dtype=np.float64)
+                    y_min_state = float(np.nanmin(state_metric_values)) * 0.95
+                    y_max_state = float(np.nanmax(state_metric_values)) * 1.05
+
+                    # The history is year-sorted, so the frame for year Y is the prefix of rows up
+                    # to Y: plain array slices fed to go.Scatter, with no cumulative long table
+                    state_frame_years = np.unique(state_years)
+                    state_frame_ends = np.searchsorted(state_years, state_frame_years, side="right")
+                    state_trend_frames = [
+                        go.Frame(name=str(year), data=[go.Scatter(x=state_years[:end], y=state_metric_values[:end], _validate=False)], _validate=False)
+                        for year, end in zip(state_frame_years, state_frame_ends)
+                    ]
+                    fig_state_trend = go.Figure(
+                        data=[go.Scatter(
+                            x=state_years[:state_frame_ends[0]], y=state_metric_values[:state_frame_ends[0]],
+                            mode="lines+markers", name=selected_state_map,
+                            hovertemplate=f"Year: %{{x}}<br>{y_axis_title}: %{{y}}<extra></extra>",
+                            _validate=False
+                        )],
+                        frames=state_trend_frames,
+                        _validate=False
+                    )
+
+                    fig_state_trend.update_layout(
+                        # Nested dicts, as for the district trend: with _validate=False a plain title
+                        # str cannot take a title_font_size update
+                        title=dict(text=f"Animated Trend of {metric} for {pulse_type} ({season}) in {selected_state_map}", font=dict(size=18)),
+                        xaxis=dict(title=dict(text="Year"), range=[int(state_years.min()), int(state_years.max())]),
+                        yaxis=dict(title=dict(text=y_axis_title), range=[y_min_state, y_max_state]),
+                        font=dict(family="Poppins", size=12), legend=dict(title=dict(text="Metric")),
+                        sliders=[{'currentvalue': {'prefix': 'Year: '}, 'pad': {'t': 20},
+                                  'steps': [{'args': [[str(year)], SLIDER_STEP_ANIMATION],
+                                             'label': str(year), 'method': 'animate'} for year in state_frame_years]}],
+                        updatemenus=[{'type': 'buttons', 'showactive': False, 'x': 0.05, 'y': -0.15,
+                                      'buttons': [{'label': 'Play', 'method': 'animate', 'args': [None, {'frame': {'duration': 100, 'redraw': True}, 'fromcurrent': True, 'transition': {'duration': 0}}]},
+                                                  {'label': 'Pause', 'method': 'animate', "args": [[None], {'frame': {'duration': 50, 'redraw': False}, 'mode': 'immediate', 'transition': {'duration': 0}}]}]}]
+                    )
+                    st.session_state.state_trend_fig = fig_state_trend
+                    st.session_state.state_trend_fig_key = state_trend_fig_key
+                st.plotly_chart(st.session_state.state_trend_fig, use_container_width=True)
             else:
                 st.warning(f"No historical data with values for '{metric}' is available to plot a trend for {selected_state_map}. Animated data list was empty or missing metric.")
         else:
@@ -484,103 +905,62 @@ st.subheader("�🇳 Full India District Map View (Fabricated Values)")
 
 # This section needs `data_loaded_successfully` and also assumes `gdf_districts` is properly loaded.
 if data_loaded_successfully and not df_pulses.empty and "Year" in df_pulses.columns and metric in df_pulses.columns and "State" in df_pulses.columns and gdf_districts is not None and not gdf_districts.empty:
-    all_years_for_full_map = sorted(df_pulses["Year"].unique())
-    st.info(f"Years for Full India District Map: {all_years_for_full_map}")
-
-    # Create a base DataFrame to hold all fabricated district data for all years in the decade
-    all_fabricated_district_data = []
-
-    # Check for critical columns in gdf_districts before loop
-    if not (district_col in gdf_districts.columns and state_col in gdf_districts.columns):
-        st.error(f"Missing expected columns ('{district_col}' or '{state_col}') in gdf_districts for full map processing. Cannot generate map.")
-        all_years_for_full_map = [] # Prevent loop from running
-
-    for year in all_years_for_full_map:
-        df_current_year_states = df_pulses[df_pulses["Year"] == year].copy()
-        st.info(f"Processing Year: {year} for Full India District Map. States with data: {len(df_current_year_states)}")
-
-        all_districts = gdf_districts[district_col].dropna().unique().tolist()
-        year_dummy_data = {d: np.nan for d in all_districts} # Initialize with NaN
-
-        for index, row in df_current_year_states.iterrows():
-            state_name_from_data = row["State"]
-            state_total_value = row[metric]
-
-            normalized_state_name_data = state_name_from_data.upper().replace(" ", "")
-
-            state_districts = gdf_districts[
-                gdf_districts[state_col].str.upper().str.replace(" ", "") == normalized_state_name_data
-            ][district_col].dropna().unique().tolist()
-
-            n_districts = len(state_districts)
-
-            if n_districts > 0 and pd.notna(state_total_value):
-                proportions = np.random.dirichlet(np.ones(n_districts))
-                dummy_values = proportions * state_total_value
-
-                for i, district_name in enumerate(state_districts):
-                    year_dummy_data[district_name] = dummy_values[i]
-        
-        df_year_fabricated = pd.DataFrame({
-            district_col: list(year_dummy_data.keys()),
-            "Dummy_Value": list(year_dummy_data.values()),
-            "Year": year
-        })
-        all_fabricated_district_data.append(df_year_fabricated)
-
-    if all_fabricated_district_data:
-        combined_fabricated_data_df = pd.concat(all_fabricated_district_data, ignore_index=True)
-        st.info(f"Combined fabricated data (DataFrame) rows: {len(combined_fabricated_data_df)}")
-        st.info(f"Sample combined_fabricated_data_df head:\n{combined_fabricated_data_df.head().to_string()}")
-
-        animated_full_india_districts_gdf = gdf_districts.merge(
-            combined_fabricated_data_df,
-            on=district_col,
-            how="left"
-        )
-        st.info(f"Final animated_full_india_districts_gdf rows after merge: {len(animated_full_india_districts_gdf)}")
-        st.info(f"Sample final animated_full_india_districts_gdf head:\n{animated_full_india_districts_gdf.head().to_string()}")
-
-        # Check size of the GeoDataFrame before plotting
-        geo_df_size_mb = sys.getsizeof(animated_full_india_districts_gdf) / (1024 * 1024)
-        st.info(f"Size of animated_full_india_districts_gdf before plotting: {geo_df_size_mb:.2f} MB")
-
-
-        fig_full_india_districts = px.choropleth(
-            animated_full_india_districts_gdf,
-            geojson=animated_full_india_districts_gdf.geometry.__geo_interface__, # Pass geometry interface
-            locations=district_col,
-            featureidkey=f"properties.{district_col}", # Match against properties in the GeoDataFrame
-            color="Dummy_Value",
-            hover_name=district_col,
-            animation_frame="Year",
-            color_continuous_scale="YlOrRd",
-            title=f"Full India District Map - {metric} ({season}, {pulse_type}) Over Time (Fabricated Values)",
-            labels={"Dummy_Value": unit}
-        )
-
-        fig_full_india_districts.update_geos(fitbounds="locations", visible=False)
-        fig_full_india_districts.update_layout(
-            coloraxis_colorbar=dict(title=unit),
-            margin={"r": 0, "t": 40, "l": 0, "b": 0},
-            updatemenus=[{
-                "type": "buttons",
-                "buttons": [
-                    {"label": "Play", "method": "animate", "args": [None, {"frame": {"duration": 200, "redraw": True}, "fromcurrent": True, "transition": {"duration": 0, "easing": "linear"}}]},
-                    {"label": "Pause", "method": "animate", "args": [[None], {"mode": "immediate", "frame": {"duration": 0}, "transition": {"duration": 0}}]}
-                ],
-                "direction": "left", "pad": {"r": 10, "t": 87}, "showactive": False, "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top"
-            }],
-            sliders=[{
-                "steps": [{"args": [[year], {"frame": {"duration": 200, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}],
-                           "label": str(year), "method": "animate"} for year in all_years_for_full_map],
-                "active": 0, "transition": {"duration": 0}, "x": 0.1, "pad": {"b": 10, "t": 50}, "len": 0.9
-            }]
-        )
-        color_min_full = animated_full_india_districts_gdf["Dummy_Value"].min()
-        color_max_full = animated_full_india_districts_gdf["Dummy_Value"].max()
-        fig_full_india_districts.update_coloraxes(cmin=color_min_full, cmax=color_max_full)
-        st.plotly_chart(fig_full_india_districts, use_container_width=True)
+    # Like the states map, the district map only depends on these inputs and is reused
+    # across reruns triggered by the state or district selectors
+    full_india_fig_key = (season, pulse_type, metric, selected_decade_range, districts_mtime)
+    if st.session_state.full_india_fig_key != full_india_fig_key:
+        if show_debug_info:
+            st.info(f"Years for Full India District Map: {sorted(df_pulses['Year'].unique())}")
+
+        combined_fabricated_data_df = pd.DataFrame()
+        fig_full_india_districts = None
+
+        # Check for critical columns in gdf_districts before processing
+        if not (district_col in gdf_districts.columns and state_col in gdf_districts.columns):
+            st.error(f"Missing expected columns ('{district_col}' or '{state_col}') in gdf_districts for full map processing. Cannot generate map.")
+        else:
+            # Fabrication is cached on the table contents
+            combined_fabricated_data_df = fabricate_district_values(
+                df_pulses[["_ST_KEY", "Year", metric]],
+                gdf_districts[["_ST_KEY", district_col]],
+                district_col,
+                metric
+            )
+
+        if not combined_fabricated_data_df.empty:
+            if show_debug_info:
+                st.info(f"Combined fabricated data (DataFrame) rows: {len(combined_fabricated_data_df)}")
+                st.info(f"Sample combined_fabricated_data_df head:\n{combined_fabricated_data_df.head().to_string()}")
+                # Check size of the plotted table before plotting
+                data_size_mb = sys.getsizeof(combined_fabricated_data_df) / (1024 * 1024)
+                st.info(f"Size of combined_fabricated_data_df before plotting: {data_size_mb:.2f} MB")
+
+            # Geometry is sent once for all districts instead of once per year; the animation
+            # frames only carry a (years x districts) value table. Locations are keyed on
+            # state + district because some district names repeat across states.
+            full_india_values_by_year = district_values_by_year(combined_fabricated_data_df, "_DIST_KEY")
+            # Hover shows the district name, not the "_DIST_KEY" column label
+            full_india_district_names = (
+                gdf_districts[["_DIST_KEY", district_col]].drop_duplicates("_DIST_KEY").set_index("_DIST_KEY")[district_col]
+            )
+            fig_full_india_districts = animated_choropleth_map(
+                full_india_values_by_year,
+                geojson=districts_geojson(mtime=districts_mtime), # Same feature dicts as the state district map
+                featureidkey="id", # Integer district ids, see district_feature_ids()
+                locations=district_feature_ids(districts_mtime).loc[list(full_india_values_by_year.columns)].tolist(),
+                hover_text=full_india_district_names.loc[list(full_india_values_by_year.columns)].tolist(),
+                bounds=gdf_districts.total_bounds,
+                title=f"Full India District Map - {metric} ({season}, {pulse_type}) Over Time (Fabricated Values)",
+                unit=unit,
+                value_label=unit,
+                colorscale="YlOrRd",
+                opacity=0.7
+            )
+        st.session_state.full_india_fig = fig_full_india_districts
+        st.session_state.full_india_fig_key = full_india_fig_key
+
+    if st.session_state.full_india_fig is not None:
+        st.plotly_chart(st.session_state.full_india_fig, use_container_width=True)
     else:
         st.warning("Could not generate animated full India district map. No fabricated data available.")
 else:
@@ -591,64 +971,66 @@ else:
 st.markdown("---")
 st.subheader("📽️ Animated District-wise Trend (Simulated Data)")
 
-if selected_state_map != "None":
+# When hidden, the district lookup, selector and figure below are all skipped
+show_district_trend = st.sidebar.checkbox("📽️ Show District Trend Simulation", value=True)
+
+if show_district_trend and selected_state_map != "None":
     if gdf_districts is not None and not gdf_districts.empty and state_col in gdf_districts.columns and district_col in gdf_districts.columns:
-        filtered_districts_for_line_plot = gdf_districts[
-            gdf_districts[state_col].str.upper().str.replace(" ", "") == normalized_selected_state
-        ][district_col].dropna().unique().tolist()
-        filtered_districts_for_line_plot = sorted(filtered_districts_for_line_plot)
-        st.info(f"Filtered districts for line plot: {filtered_districts_for_line_plot}")
+        filtered_districts_for_line_plot = sorted_districts_by_state(district_col, districts_mtime).get(normalized_selected_state, [])
+        if show_debug_info:
+            st.info(f"Filtered districts for line plot: {filtered_districts_for_line_plot}")
     else:
         st.warning("GeoDataFrame for districts is not loaded or missing required columns for district filter.")
         filtered_districts_for_line_plot = []
 else:
     filtered_districts_for_line_plot = []
 
-if filtered_districts_for_line_plot:
+if not show_district_trend:
+    selected_district_for_line_plot = None
+elif filtered_districts_for_line_plot:
     selected_district_for_line_plot = st.sidebar.selectbox("🎯 Select a District for Trend Animation", filtered_districts_for_line_plot)
 else:
     selected_district_for_line_plot = None
     st.sidebar.warning("No districts available for selected state for trend plot.")
 
 if selected_district_for_line_plot:
-    years_simulated = np.arange(2000, 2024)
-    np.random.seed(42)
-    random_values_simulated = np.random.uniform(low=50, high=300, size=len(years_simulated))
-
-    district_trend_simulated_df = pd.DataFrame({
-        "Year": years_simulated,
-        "Value": random_values_simulated,
-        "District": selected_district_for_line_plot
-    })
-
-    animation_frames_district_line_simulated = []
-    for year in years_simulated:
-        frame_df = district_trend_simulated_df[district_trend_simulated_df["Year"] <= year].copy()
-        frame_df["FrameYear"] = year
-        animation_frames_district_line_simulated.append(frame_df)
-
-    animated_district_line_simulated_df = pd.concat(animation_frames_district_line_simulated, ignore_index=True)
-    st.info(f"Animated simulated district line data rows: {len(animated_district_line_simulated_df)}")
-
-    y_min_simulated = random_values_simulated.min() * 0.95
-    y_max_simulated = random_values_simulated.max() * 1.05
-
-    fig_district_trend_simulated = px.line(
-        animated_district_line_simulated_df,
-        x="Year", y="Value", animation_frame="FrameYear", animation_group="District",
-        title=f"Animated Trend for {selected_district_for_line_plot} (Simulated, {years_simulated.min()}–{years_simulated.max()})",
-        markers=True, labels={"Year": "Year", "Value": "Simulated Value", "FrameYear": "Year"},
-        range_y=[y_min_simulated, y_max_simulated], range_x=[years_simulated.min(), years_simulated.max()]
-    )
+    years_simulated, random_values_simulated, y_min_simulated, y_max_simulated = simulated_district_series()
+
+    # Frames come from the per-process cache; the figure around them only changes with the
+    # district (names repeat across states, hence the state in the key), so other reruns
+    # reuse the one built for the previous run
+    district_trend_fig_key = (normalized_selected_state, selected_district_for_line_plot)
+    if st.session_state.district_trend_fig_key != district_trend_fig_key:
+        fig_district_trend_simulated = go.Figure(
+            data=[go.Scatter(
+                x=years_simulated[:1], y=random_values_simulated[:1],
+                mode="lines+markers", name=selected_district_for_line_plot,
+                hovertemplate="Year: %{x}<br>Simulated Value: %{y}<extra></extra>",
+                _validate=False
+            )],
+            frames=simulated_trend_frames(),
+            _validate=False
+        )
 
-    fig_district_trend_simulated.update_layout(
-        xaxis_title="Year", yaxis_title="Simulated Metric",
-        font=dict(family="Poppins", size=12), title_font_size=18,
-        sliders=[{'currentvalue': {'prefix': 'Year: '}, 'pad': {'t': 20}}],
-        updatemenus=[{'type': 'buttons', 'showactive': False, 'x': 0.05, 'y': -0.15,
-                      'buttons': [{'label': 'Play', 'method': 'animate', 'args': [None, {'frame': {'duration': 200, 'redraw': True}, 'fromcurrent': True, 'transition': {'duration': 0}}]},
-                                  {'label': 'Pause', 'method': 'animate', "args": [[None], {'frame': {'duration': 50, 'redraw': False}, 'mode': 'immediate', 'transition': {'duration': 0}}]}]}]
-    )
-    st.plotly_chart(fig_district_trend_simulated, use_container_width=True)
+        fig_district_trend_simulated.update_layout(
+            # Nested dicts rather than title_font_size / xaxis_title style paths: the figure is
+            # built with _validate=False, so "title" would otherwise stay a plain str and the
+            # magic-underscore update fails on it
+            title=dict(text=f"Animated Trend for {selected_district_for_line_plot} (Simulated, {years_simulated.min()}–{years_simulated.max()})", font=dict(size=18)),
+            xaxis=dict(title=dict(text="Year"), range=[int(years_simulated.min()), int(years_simulated.max())]),
+            yaxis=dict(title=dict(text="Simulated Metric"), range=[y_min_simulated, y_max_simulated]),
+            font=dict(family="Poppins", size=12),
+            sliders=[{'currentvalue': {'prefix': 'Year: '}, 'pad': {'t': 20},
+                      'steps': [{'args': [[str(year)], SLIDER_STEP_ANIMATION],
+                                 'label': str(year), 'method': 'animate'} for year in years_simulated]}],
+            updatemenus=[{'type': 'buttons', 'showactive': False, 'x': 0.05, 'y': -0.15,
+                          'buttons': [{'label': 'Play', 'method': 'animate', 'args': [None, {'frame': {'duration': 200, 'redraw': True}, 'fromcurrent': True, 'transition': {'duration': 0}}]},
+                                      {'label': 'Pause', 'method': 'animate', "args": [[None], {'frame': {'duration': 50, 'redraw': False}, 'mode': 'immediate', 'transition': {'duration': 0}}]}]}]
+        )
+        st.session_state.district_trend_fig = fig_district_trend_simulated
+        st.session_state.district_trend_fig_key = district_trend_fig_key
+    st.plotly_chart(st.session_state.district_trend_fig, use_container_width=True)
+elif not show_district_trend:
+    st.info("District-wise trend simulation is hidden. Enable it from the sidebar.")
 else:
     st.info("Please select a state to view district-wise trend simulation.")
@@ -3,10 +3,11 @@ import pandas as pd
 import os
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from growth_analysis import plot_logest_growth_from_csv
 from world_map import show_world_timelapse_map
 import glob
-import json
+import orjson
 import numpy as np 
 import geopandas as gpd
 import matplotlib.pyplot as plt
@@ -19,6 +20,9 @@ from streamlit.components.v1 import html
 from matplotlib import colormaps  # New API in matplotlib >=3.7
 
 
+# Serialize figures with orjson instead of the default JSON encoder
+pio.json.config.default_engine = "orjson"
+
 # Page setup
 st.set_page_config(layout="wide", page_title="India FoodCrop Dashboard", page_icon="🌾")
 
@@ -848,8 +852,8 @@ st.plotly_chart(fig_district_trend, use_container_width=True)
 
 def show_india_timelapse_map(df, geojson_path, metric_title="Production", default_unit="Tonnes"):
     # Load GeoJSON file
-    with open(geojson_path, "r") as f:
-        india_states_geojson = json.load(f)
+    with open(geojson_path, "rb") as f:
+        india_states_geojson = orjson.loads(f.read())
 
     # Determine unit
     unit = df["Unit"].iloc[0] if "Unit" in df.columns and not df["Unit"].isna().all() else default_unit
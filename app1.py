@@ -1,17 +1,33 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
+import plotly.graph_objects as go
+import geopandas as gpd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
+import plotly.io as pio
+import orjson
+from urllib.request import urlopen
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # --- Configuration ---
+# Serialize figures with orjson instead of the default JSON encoder
+pio.json.config.default_engine = "orjson"
 st.set_page_config(layout="wide", page_title="India Pulses Data Dashboard", page_icon="🌾")
 
 # --- Constants ---
 DATA_DIR = "Data"
+# Parquet copy of the combined, preprocessed CSVs, tagged with the CSV names and mtimes it
+# was built from (rebuilt when they change)
+COMBINED_CACHE_PATH = os.path.join(DATA_DIR, "_combined.parquet")
+COMBINED_CACHE_KEY_FIELD = b"pulse_sources"
 GEOJSON_URL = "https://raw.githubusercontent.com/geohacker/india/master/state/india_state.geojson"
 
+# Tolerance (degrees) for simplifying the state polygons before they are sent to Plotly
+GEOJSON_SIMPLIFY_TOLERANCE = 0.01
+
 # List of all pulse data files (ensure these match your uploaded file names exactly)
 PULSE_FILES = [
     "Pulses_Data.xlsx - Arhar.csv",
@@ -29,6 +45,24 @@ PULSE_FILES = [
     # "Pulses_Data.xlsx - Status.csv" # Exclude status as it doesn't seem to contain pulse data
 ]
 
+# CSV columns read besides the state column, and their dashboard names
+CSV_PARAMETER_COLUMNS = {
+    'Year': 'Year',
+    'Area (1000 Ha.)': 'Area',
+    'Production (1000 Tonnes)': 'Production',
+    'Yield (Kg./Ha.)': 'Yield'
+}
+
+# Pulse CSVs are read in pieces of this size and reduced before the pieces are combined
+CSV_BLOCK_BYTES = 16 << 20
+CSV_CHUNK_ROWS = 50_000
+# Cells read as missing in every column, including the state names: the default na_values
+# of pd.read_csv, so the Arrow reader and the pandas fallback drop the same rows
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"
+]
+
 # Mapping for standardizing state names between GeoJSON and your data
 # Add more mappings if you encounter discrepancies
 STATE_NAME_MAPPING = {
@@ -74,100 +108,287 @@ STATE_NAME_MAPPING = {
 REVERSE_STATE_NAME_MAPPING = {v: k for k, v in STATE_NAME_MAPPING.items()}
 
 
+def load_pulse_file(file_name):
+    """
+    Reads one pulse CSV: only the state and parameter columns, under their dashboard names,
+    tagged with the pulse type/season. Cleaning happens once on the combined table in
+    load_data(). Runs on a worker thread, so instead of calling Streamlit it returns
+    (DataFrame or None, warning/error message or None).
+    """
+    file_path = os.path.join(DATA_DIR, file_name)
+    try:
+        # Read the header first so only the state, year and parameter columns are parsed
+        header = pd.read_csv(file_path, nrows=0).columns
+
+        # Rename columns based on user confirmation
+        # Prioritize 'State/UT', if not found, try 'States/UTs'
+        if 'State/UT' in header:
+            state_column = 'State/UT'
+        elif 'States/UTs' in header:
+            state_column = 'States/UTs'
+        else:
+            # Skip this file if state column is missing
+            return None, ("warning", f"Could not find 'State/UT' or 'States/UTs' in {file_name}. Check data columns.")
+
+        missing_columns = [col for col in CSV_PARAMETER_COLUMNS if col not in header]
+        if missing_columns:
+            return None, ("error", f"Error loading or processing {file_name}: missing column(s) {missing_columns}")
+
+        # Arrow's streaming CSV reader, parsing only the needed columns straight to
+        # string/float64, one block at a time. Rows with a missing value are dropped per
+        # block (load_data() would drop them anyway), so a large file never has to be held
+        # in full before it is reduced. A non-numeric marker in a parameter column fails the
+        # typed read; such a file is parsed as text by pandas in chunks and coerced to NaN
+        # in load_data()
+        try:
+            reader = pacsv.open_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=[state_column, *CSV_PARAMETER_COLUMNS],
+                    column_types={state_column: pa.string(), **{col: pa.float64() for col in CSV_PARAMETER_COLUMNS}},
+                    null_values=CSV_NULL_VALUES,
+                    strings_can_be_null=True
+                )
+            )
+            batches = [pc.drop_null(batch) for batch in reader]
+            df = pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+        except pa.ArrowInvalid:
+            chunks = pd.read_csv(
+                file_path,
+                usecols=[state_column, *CSV_PARAMETER_COLUMNS],
+                dtype={state_column: str},
+                chunksize=CSV_CHUNK_ROWS
+            )
+            reduced = [chunk.dropna() for chunk in chunks]
+            df = pd.concat(reduced, ignore_index=True) if reduced else pd.DataFrame(columns=[state_column, *CSV_PARAMETER_COLUMNS])
+        df.rename(columns={state_column: 'State', **CSV_PARAMETER_COLUMNS}, inplace=True)
+
+        # Extract pulse type/season from filename
+        pulse_type_season = file_name.replace("Pulses_Data.xlsx - ", "").replace(".csv", "").strip()
+        df['Pulse_Type_Season'] = pulse_type_season
+        return df, None
+
+    except Exception as e:
+        return None, ("error", f"Error loading or processing {file_name}: {e}")
+
 @st.cache_data
 def load_data():
     """Loads and preprocesses all pulse data files."""
-    all_dfs = []
     for file_name in PULSE_FILES:
         file_path = os.path.join(DATA_DIR, file_name)
         if not os.path.exists(file_path):
             st.error(f"Error: Data file not found at '{file_path}'. Please ensure all CSVs are in the 'data' directory.")
             return pd.DataFrame() # Return empty DataFrame to prevent further errors
 
-        try:
-            df = pd.read_csv(file_path)
-
-            # Extract pulse type/season from filename
-            pulse_type_season = file_name.replace("Pulses_Data.xlsx - ", "").replace(".csv", "").strip()
-            df['Pulse_Type_Season'] = pulse_type_season
-
-            # Rename columns based on user confirmation
-            # Prioritize 'State/UT', if not found, try 'States/UTs'
-            if 'State/UT' in df.columns:
-                df.rename(columns={'State/UT': 'State'}, inplace=True)
-            elif 'States/UTs' in df.columns:
-                df.rename(columns={'States/UTs': 'State'}, inplace=True)
-            else:
-                st.warning(f"Could not find 'State/UT' or 'States/UTs' in {file_name}. Check data columns.")
-                continue # Skip this file if state column is missing
-
-            # Rename parameter columns
-            df.rename(columns={
-                'Area (1000 Ha.)': 'Area',
-                'Production (1000 Tonnes)': 'Production',
-                'Yield (Kg./Ha.)': 'Yield'
-            }, inplace=True)
-
-            # Convert relevant columns to numeric, coercing errors
-            for col in ['Year', 'Area', 'Production', 'Yield']:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-
-            # Drop rows where essential columns are NaN
-            df.dropna(subset=['State', 'Year', 'Area', 'Production', 'Yield'], inplace=True)
-
-            # Apply state name mapping for standardization
-            df['State'] = df['State'].replace(STATE_NAME_MAPPING)
-            all_dfs.append(df)
-
-        except Exception as e:
-            st.error(f"Error loading or processing {file_name}: {e}")
-            continue
+    # Reuse the combined table from the last parse while it was built from exactly these
+    # files at these mtimes (only the Parquet footer is read for the check)
+    source_key = orjson.dumps([[file_name, os.path.getmtime(os.path.join(DATA_DIR, file_name))] for file_name in PULSE_FILES])
+    try:
+        cache_metadata = pq.read_schema(COMBINED_CACHE_PATH).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        cache_metadata = {}
+    if cache_metadata.get(COMBINED_CACHE_KEY_FIELD) == source_key:
+        return pd.read_parquet(COMBINED_CACHE_PATH)
+
+    # The files are parsed on a thread pool (pandas releases the GIL while parsing); results
+    # come back in PULSE_FILES order and messages are shown from this thread
+    all_dfs = []
+    all_loaded_cleanly = True
+    with ThreadPoolExecutor(max_workers=min(8, len(PULSE_FILES))) as executor:
+        for df, message in executor.map(load_pulse_file, PULSE_FILES):
+            if message is not None:
+                level, text = message
+                getattr(st, level)(text)
+                all_loaded_cleanly = False
+            if df is not None:
+                all_dfs.append(df)
 
     if not all_dfs:
         return pd.DataFrame()
 
+    # One concat, then each cleaning step runs once over the combined columns instead of
+    # once per file
     combined_df = pd.concat(all_dfs, ignore_index=True)
+
+    # Convert relevant columns to numeric, coercing errors
+    for col in ['Year', 'Area', 'Production', 'Yield']:
+        combined_df[col] = pd.to_numeric(combined_df[col], errors='coerce')
+
+    # Drop rows where essential columns are NaN
+    combined_df.dropna(subset=['State', 'Year', 'Area', 'Production', 'Yield'], inplace=True)
+    combined_df.reset_index(drop=True, inplace=True)
+
+    # Narrow dtypes: the parameters fit float32 and years int16, and a dozen pulse
+    # type/season labels repeat over every row, so every later filter and the frame
+    # arrays move half the bytes or less
+    combined_df = combined_df.astype({
+        'Year': 'int16', 'Area': 'float32', 'Production': 'float32', 'Yield': 'float32',
+        'Pulse_Type_Season': 'category'
+    })
+
+    # A few dozen state names repeated over every file and year: as a categorical the name
+    # mapping below touches each distinct name once, and later filters compare integer codes
+    states = combined_df['State'].astype(str).astype('category')
+    # Apply state name mapping for standardization (two names may map to one, so the
+    # result is re-encoded instead of renaming categories in place)
+    combined_df['State'] = states.map({name: STATE_NAME_MAPPING.get(name, name) for name in states.cat.categories}).astype('category')
+
+    # Typed columnar copy for the next cold start; a read-only deployment just reparses.
+    # Skipped when any file failed, so a partial table is never served silently later
+    if all_loaded_cleanly:
+        table = pa.Table.from_pandas(combined_df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), COMBINED_CACHE_KEY_FIELD: source_key})
+        try:
+            pq.write_table(table, COMBINED_CACHE_PATH, compression="zstd")
+        except OSError:
+            pass
     return combined_df
 
-@st.cache_data
+@st.cache_resource
 def load_geojson():
-    """Loads the GeoJSON file for India states."""
+    """
+    Loads the GeoJSON file for India states, simplified and reduced to the "ST_NM" property.
+    Cached as a shared resource: the dict is only read, so reruns skip the per-run copy.
+    """
     try:
-        india_states_geojson = px.data.get_geojson(GEOJSON_URL)
-        return india_states_geojson
+        # orjson parses the nested coordinate arrays several times faster than json
+        with urlopen(GEOJSON_URL, timeout=30) as response:
+            india_states_geojson = orjson.loads(response.read())
+        # Rendering cost and figure size follow the vertex count; simplify once here
+        states = gpd.GeoDataFrame.from_features(india_states_geojson["features"])
+        states["geometry"] = states.geometry.simplify(GEOJSON_SIMPLIFY_TOLERANCE, preserve_topology=True)
+        return states[["ST_NM", "geometry"]].__geo_interface__
     except Exception as e:
         st.error(f"Error loading GeoJSON: {e}. Please check the URL or your internet connection.")
         return None
 
+def build_animated_state_choropleth(df, year_rows, geojson, parameter, title, start_year):
+    """
+    Builds one state choropleth with a Plotly frame per year, animated in the browser.
+    The GeoJSON is sent once on the base trace; each frame only carries that year's
+    locations and values, so playback needs no Streamlit reruns.
+    year_rows maps each year to its row positions in df (see pulse_type_season_rows).
+    """
+    # Each frame gathers its slice from the two column arrays instead of materializing a
+    # per-year DataFrame
+    states = df['State'].to_numpy()
+    values = df[parameter].to_numpy()
+    # The hover shows state, value and year like the former Plotly Express hover_data, but
+    # the year is written into each frame's template once instead of shipped per state
+    # (as customdata or an extra column)
+    hovertemplate = "<b>%{{location}}</b><br>{parameter}: %{{z:,.2f}}<br>Year: {year}<extra></extra>"
+    frames = []
+    for year in sorted(year_rows):
+        rows = year_rows[year]
+        frames.append(go.Frame(
+            name=str(int(year)),
+            data=[go.Choropleth(
+                locations=states[rows], z=values[rows],
+                hovertemplate=hovertemplate.format(parameter=parameter, year=int(year)), _validate=False
+            )],
+            layout={"title": {"text": f"{title} in {int(year)}"}},
+            _validate=False
+        ))
+    trace = go.Choropleth(
+        geojson=geojson,
+        featureidkey="properties.ST_NM", # Key in GeoJSON that matches 'State' column
+        coloraxis="coloraxis",
+        _validate=False
+    )
+    play_args = {"frame": {"duration": 800, "redraw": True}, "fromcurrent": True, "transition": {"duration": 0}}
+    step_args = {"frame": {"duration": 0, "redraw": True}, "mode": "immediate", "transition": {"duration": 0}}
+    layout = {
+        "height": 600,
+        "margin": {"r": 0, "t": 50, "l": 0, "b": 0},
+        "geo": {"projection": {"type": "mercator"}, "fitbounds": "locations", "visible": False},
+        # One colour scale for all years, so frames are comparable
+        "coloraxis": {"colorscale": "Viridis", "cmin": float(df[parameter].min()), "cmax": float(df[parameter].max()),
+                      "colorbar": {"title": {"text": parameter}}},
+        "updatemenus": [{
+            "type": "buttons", "showactive": False, "x": 0.1, "xanchor": "right", "y": 0, "yanchor": "top",
+            "buttons": [
+                {"label": "▶️ Play", "method": "animate", "args": [None, play_args]},
+                {"label": "⏸️ Pause", "method": "animate", "args": [[None], {**step_args, "frame": {"duration": 0, "redraw": False}}]}
+            ]
+        }],
+        "sliders": [{
+            "x": 0.1, "len": 0.9, "currentvalue": {"prefix": "Year: "},
+            "steps": [{"args": [[frame.name], step_args], "label": frame.name, "method": "animate"} for frame in frames]
+        }],
+    }
+    fig = go.Figure(data=[trace], layout=layout, frames=frames, _validate=False)
+    show_start_year(fig, start_year)
+    return fig
+
+def show_start_year(fig, start_year):
+    """
+    Points an animated figure at start_year: copies that year's frame into the base trace
+    and moves the slider to it. The geometry and the other frames are left as they are.
+    """
+    start_index = next(i for i, frame in enumerate(fig.frames) if frame.name == str(int(start_year)))
+    start_frame = fig.frames[start_index]
+    fig.data[0].locations = start_frame.data[0].locations
+    fig.data[0].z = start_frame.data[0].z
+    fig.data[0].hovertemplate = start_frame.data[0].hovertemplate
+    fig.layout.title.text = start_frame.layout.title.text
+    fig.layout.sliders[0].active = start_index
+
+@st.cache_resource
+def load_map_data():
+    """
+    The combined pulse data restricted to states present in the GeoJSON. Built once per
+    process and shared read-only, so a rerun neither rebuilds the GeoJSON name set and
+    state filter nor unpickles a fresh copy of the table.
+    """
+    df_combined = load_data()
+    geojson_data = load_geojson()
+    if df_combined.empty or geojson_data is None:
+        return pd.DataFrame()
+
+    # Filter out states that are not in the GeoJSON after mapping (optional, for cleaner data)
+    # First, get unique state names from GeoJSON properties
+    geojson_state_names = {feature['properties']['ST_NM'] for feature in geojson_data['features']}
+    # Apply reverse mapping to match the GeoJSON names to our standardized names
+    standardized_geojson_names = {REVERSE_STATE_NAME_MAPPING.get(name, name) for name in geojson_state_names}
+
+    # Filter df_combined to include only states present in GeoJSON (isin on the categorical
+    # checks each distinct name once and selects rows by code)
+    return df_combined[df_combined['State'].isin(standardized_geojson_names)]
+
+@st.cache_resource
+def pulse_type_season_options():
+    """Sorted pulse type/season names for the selector, computed once per process."""
+    return sorted(load_map_data()['Pulse_Type_Season'].unique().tolist())
+
+@st.cache_resource
+def pulse_type_season_rows(pulse_type_season):
+    """
+    (rows, sorted years, {year: row positions}) of the map data for one pulse type/season.
+    Cached per selection and shared read-only, so reruns skip the row filter and the year
+    list, and switching the parameter reuses the per-year row positions.
+    """
+    df_combined = load_map_data()
+    rows = df_combined[df_combined['Pulse_Type_Season'] == pulse_type_season]
+    year_rows = rows.groupby('Year').indices
+    return rows, sorted(year_rows), year_rows
+
 # --- Dashboard Layout ---
 st.title("🌾 India Pulses Data Dashboard")
 
 # Load data and GeoJSON
-df_combined = load_data()
 geojson_data = load_geojson()
+df_combined = load_map_data()
 
 if df_combined.empty or geojson_data is None:
     st.stop() # Stop execution if data or geojson failed to load
 
-# Ensure 'State' is of type string for merging with geojson properties
-df_combined['State'] = df_combined['State'].astype(str)
-
-# Filter out states that are not in the GeoJSON after mapping (optional, for cleaner data)
-# First, get unique state names from GeoJSON properties
-geojson_state_names = {feature['properties']['ST_NM'] for feature in geojson_data['features']}
-# Apply reverse mapping to match the GeoJSON names to our standardized names
-standardized_geojson_names = {REVERSE_STATE_NAME_MAPPING.get(name, name) for name in geojson_state_names}
-
-# Filter df_combined to include only states present in GeoJSON
-df_combined = df_combined[df_combined['State'].isin(standardized_geojson_names)]
-
 
 # --- Sidebar Controls ---
 st.sidebar.header("Dashboard Controls")
 
 # Select Pulse Type/Season
-pulse_types_seasons = sorted(df_combined['Pulse_Type_Season'].unique().tolist())
+pulse_types_seasons = pulse_type_season_options()
 selected_pulse_type_season = st.sidebar.selectbox(
     "Select Pulse Type / Season:",
     pulse_types_seasons,
@@ -175,7 +396,7 @@ selected_pulse_type_season = st.sidebar.selectbox(
 )
 
 # Filter data based on selected pulse type/season
-df_filtered_pulse = df_combined[df_combined['Pulse_Type_Season'] == selected_pulse_type_season]
+df_filtered_pulse, years, year_rows = pulse_type_season_rows(selected_pulse_type_season)
 
 # Select Parameter
 parameters = ['Area', 'Production', 'Yield']
@@ -185,129 +406,32 @@ selected_parameter = st.sidebar.selectbox(
     help="Choose between Area (1000 Ha.), Production (1000 Tonnes), or Yield (Kg./Ha.)."
 )
 
-# Get min and max years for the selected data
-min_year = int(df_filtered_pulse['Year'].min()) if not df_filtered_pulse.empty else 1950
-max_year = int(df_filtered_pulse['Year'].max()) if not df_filtered_pulse.empty else 2020
-
-# Initialize session state for animation
-if 'playing' not in st.session_state:
-    st.session_state.playing = False
-if 'current_year_idx' not in st.session_state:
-    st.session_state.current_year_idx = 0
-
-years = sorted(df_filtered_pulse['Year'].unique().tolist())
 if not years:
     st.warning("No data available for the selected pulse type/season.")
     st.stop()
 
-# Animated year slider
+# Year the map opens on; Play in the figure animates from there in the browser
 st.sidebar.subheader("Year Animation")
-col1, col2 = st.sidebar.columns([1, 1])
-with col1:
-    if st.button("▶️ Play"):
-        st.session_state.playing = True
-with col2:
-    if st.button("⏸️ Pause"):
-        st.session_state.playing = False
-
-# Display current year and slider
-current_year = years[st.session_state.current_year_idx]
 year_slider_value = st.sidebar.slider(
     "Select Year:",
-    min_value=min_year,
-    max_value=max_year,
-    value=current_year,
+    min_value=int(years[0]),
+    max_value=int(years[-1]),
+    value=int(years[0]),
     step=1,
     key="year_slider"
 )
-
-# Update current_year_idx if slider is manually moved
-if year_slider_value != current_year:
-    st.session_state.current_year_idx = years.index(year_slider_value)
-    st.session_state.playing = False # Pause if user manually changes slider
-
-st.sidebar.markdown(f"**Current Year: {year_slider_value}**")
-
-# Animation loop (only runs if playing is True)
-if st.session_state.playing:
-    # Use st.empty to update the slider and map in place
-    placeholder = st.empty()
-    with placeholder:
-        while st.session_state.playing and st.session_state.current_year_idx < len(years):
-            st.session_state.current_year_idx = (st.session_state.current_year_idx % len(years))
-            current_animated_year = years[st.session_state.current_year_idx]
-
-            # Re-run the app to update the map with the new year
-            st.sidebar.slider(
-                "Select Year:",
-                min_value=min_year,
-                max_value=max_year,
-                value=current_animated_year,
-                step=1,
-                key="year_slider_animated" # Use a different key for animation
-            )
-            st.sidebar.markdown(f"**Current Year: {current_animated_year}**")
-
-            # Filter data for the current animated year
-            df_year = df_filtered_pulse[df_filtered_pulse['Year'] == current_animated_year]
-
-            # Create the choropleth map
-            if not df_year.empty and geojson_data:
-                fig = px.choropleth(
-                    df_year,
-                    geojson=geojson_data,
-                    featureidkey="properties.ST_NM", # Key in GeoJSON that matches 'State' column
-                    locations="State",
-                    color=selected_parameter,
-                    hover_name="State",
-                    hover_data={
-                        "State": True,
-                        selected_parameter: ':,2f', # Format parameter to 2 decimal places
-                        "Year": True
-                    },
-                    color_continuous_scale="Viridis",
-                    title=f'{selected_pulse_type_season} - {selected_parameter} in {current_animated_year}',
-                    projection="mercator",
-                    height=600
-                )
-                fig.update_geos(fitbounds="locations", visible=False)
-                fig.update_layout(margin={"r":0,"t":50,"l":0,"b":0})
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.info(f"No data to display for {selected_pulse_type_season} in {current_animated_year}.")
-
-            time.sleep(0.8) # Animation speed
-            st.session_state.current_year_idx += 1
-
-            # Loop back to start if end is reached
-            if st.session_state.current_year_idx >= len(years):
-                st.session_state.current_year_idx = 0 # Loop back to the first year
-
-
-# Display the map based on the current selected year (either manual or paused animation)
-if not st.session_state.playing:
-    df_year = df_filtered_pulse[df_filtered_pulse['Year'] == year_slider_value]
-
-    if not df_year.empty and geojson_data:
-        fig = px.choropleth(
-            df_year,
-            geojson=geojson_data,
-            featureidkey="properties.ST_NM", # Key in GeoJSON that matches 'State' column
-            locations="State",
-            color=selected_parameter,
-            hover_name="State",
-            hover_data={
-                "State": True,
-                selected_parameter: ':,2f',
-                "Year": True
-            },
-            color_continuous_scale="Viridis",
-            title=f'{selected_pulse_type_season} - {selected_parameter} in {year_slider_value}',
-            projection="mercator",
-            height=600
-        )
-        fig.update_geos(fitbounds="locations", visible=False)
-        fig.update_layout(margin={"r":0,"t":50,"l":0,"b":0})
-        st.plotly_chart(fig, use_container_width=True)
-    else:
-        st.info(f"No data to display for {selected_pulse_type_season} in {year_slider_value}.")
+start_year = min(years, key=lambda year: abs(year - year_slider_value))
+st.sidebar.markdown(f"**Current Year: {int(start_year)}**")
+
+# The figure (geometry plus every frame) only depends on the pulse type and parameter;
+# moving the year slider reuses it and just swaps the base trace's values
+fig_key = (selected_pulse_type_season, selected_parameter)
+if st.session_state.get("map_fig_key") != fig_key:
+    st.session_state.map_fig = build_animated_state_choropleth(
+        df_filtered_pulse, year_rows, geojson_data, selected_parameter,
+        f'{selected_pulse_type_season} - {selected_parameter}', start_year
+    )
+    st.session_state.map_fig_key = fig_key
+else:
+    show_start_year(st.session_state.map_fig, start_year)
+st.plotly_chart(st.session_state.map_fig, use_container_width=True)
@@ -0,0 +1,45 @@
+import os
+import pandas as pd
+
+EXCEL_PATH = "Data/Pulses_Data.xlsx"
+PULSE_SHEETS = ["Gram", "Urad", "Moong", "Masoor", "Moth", "Kulthi", "Khesari", "Peas", "Arhar"]
+PULSE_COLUMNS = ["States/UTs", "Season", "Crop", "Year", "Area", "Production", "Yield"]
+
+def convert_pulses_workbook(excel_path=EXCEL_PATH, sheets=PULSE_SHEETS):
+    """
+    One-time conversion of the pulses workbook to Parquet (written next to the workbook).
+    All sheets go into one file with a "sheet" column so the dashboard can read a
+    single sheet with a Parquet filter instead of parsing the Excel XML.
+    """
+    frames = []
+    with pd.ExcelFile(excel_path, engine="openpyxl") as workbook:
+        for sheet in sheets:
+            df = pd.read_excel(workbook, sheet_name=sheet, header=1)
+            # Headers differ between sheets ("Production\n" vs "Production") and each sheet has
+            # its own empty "Unnamed: *" columns; normalize the names and keep only the shared
+            # columns so the concatenated table has one column per field
+            df.columns = df.columns.map(str).str.strip()
+            df = df[[col for col in PULSE_COLUMNS if col in df.columns]].copy()
+            df["sheet"] = sheet
+            frames.append(df)
+
+    combined = pd.concat(frames, ignore_index=True)
+
+    # Columns whose values are all numeric are stored as numbers, so the dashboard reads them
+    # without parsing. Columns mixing text and numbers cannot be written to Parquet; store their
+    # values as text (numeric coercion happens in the dashboard anyway)
+    for col in combined.select_dtypes(include=["object", "string"]).columns:
+        numeric = pd.to_numeric(combined[col], errors="coerce")
+        if numeric.notna().sum() == combined[col].notna().sum():
+            combined[col] = numeric
+        else:
+            combined[col] = combined[col].where(combined[col].isna(), combined[col].astype(str))
+    combined["sheet"] = combined["sheet"].astype("category")
+
+    parquet_path = os.path.splitext(excel_path)[0] + ".parquet"
+    combined.to_parquet(parquet_path, compression="zstd", index=False)
+    return parquet_path
+
+if __name__ == "__main__":
+    output_path = convert_pulses_workbook()
+    print(f"Wrote {output_path}")